@@ -6,24 +6,114 @@ Pull request initiated by MenoGPT
 """
 
 import numpy as np
-import pyaudio
 import pygame
+import sounddevice as sd
 from pygame import gfxdraw
 from collections import deque
 import colorsys
 import math
 
+try:
+    # Optional: Numba compiles the per-frame spectrum kernel and rocket-fft
+    # teaches it np.fft.rfft. Without them the kernel runs as plain NumPy.
+    from numba import njit
+    import rocket_fft  # noqa: F401
+    _rfft = np.fft.rfft
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
+    
+    try:
+        # scipy.fft keeps float32 input in single precision and may reuse its buffer
+        from scipy.fft import rfft as _scipy_rfft
+        
+        def _rfft(x):
+            return _scipy_rfft(x, overwrite_x=True)
+    except ImportError:
+        _rfft = np.fft.rfft
+
+# Audio/FFT sizes are fixed at startup, so the spectrum kernel is specialized on them
+CHUNK = 2048
+RATE = 44100
+HALF = CHUNK // 2
+SMOOTH_FRAMES = 3
+
+# Spectra are stored in single precision. float16 would halve the smoothing buffer
+# again, but NumPy emulates half-precision math (~5x slower for the running sum),
+# Numba cannot compile it, and its 11-bit mantissa is too coarse for the running sum.
+# Keep the kernel signature below in sync with this.
+SPECTRUM_DTYPE = np.float32
+FFT_NORM = 1.0 / HALF
+
+# Animation constants were tuned when every frame waited for one audio block, so
+# per-frame motion is scaled by elapsed time in units of that block duration
+BLOCK_MS = 1000.0 * CHUNK / RATE
+MAX_TIME_STEP = 3.0
+
+
+def _hue_table(sat, val, size=256):
+    """RGB colors (uint8) for `size` evenly spaced hues at a fixed saturation and value"""
+    rgb = np.array([colorsys.hsv_to_rgb(h / size, sat, val) for h in range(size)])
+    return (rgb * 255).astype(np.uint8)
+
+
+@njit('Tuple((float32[::1], float32))'
+      '(int16[::1], float32[::1], float32[::1], float32[:, ::1], float32[::1], int64, int64, float32)',
+      cache=True, fastmath=True, boundscheck=False)
+def _process(data, window, scratch, smooth_buf, smooth_sum, idx, bass_end, scale):
+    """Window, FFT, log-scale and smooth one chunk of audio.
+    
+    The windowed samples are written to scratch, the new spectrum replaces
+    smooth_buf[idx] and the running sum is updated in place. Returns the
+    running sum times scale (1 / number of filled rows) and its bass energy.
+    """
+    # Apply Hamming window to reduce spectral leakage
+    np.multiply(data, window, scratch)
+    
+    # Perform FFT (input is real, so only the positive half is computed)
+    fft = _rfft(scratch)
+    
+    # Swap the oldest spectrum out of the running sum
+    magnitude = smooth_buf[idx]
+    smooth_sum -= magnitude
+    
+    # Normalize and apply logarithmic scaling for better visualization
+    magnitude[:] = np.abs(fft[:HALF])
+    magnitude *= FFT_NORM
+    magnitude += 1
+    np.log10(magnitude, magnitude)
+    magnitude *= 20
+    
+    smooth_sum += magnitude
+    
+    # Rebuild the sum from the stored rows once per cycle so float32 rounding
+    # in the incremental updates cannot accumulate over a long session
+    if idx == SMOOTH_FRAMES - 1:
+        smooth_sum[:] = smooth_buf[0]
+        for row in range(1, SMOOTH_FRAMES):
+            smooth_sum += smooth_buf[row]
+    
+    smoothed = smooth_sum * scale
+    
+    return smoothed, smoothed[:bass_end].sum()
+
+
 class AudioVisualizer:
     def __init__(self, width=1600, height=900):
         # Audio settings
-        self.CHUNK = 2048
-        self.FORMAT = pyaudio.paInt16
+        self.CHUNK = CHUNK
+        self.FORMAT = 'int16'
         self.CHANNELS = 1
-        self.RATE = 44100
+        self.RATE = RATE
+        
+        # FFT settings (window and windowing scratch buffer are reused every frame)
+        self._window = np.hamming(self.CHUNK).astype(SPECTRUM_DTYPE)
+        self._scratch = np.empty(self.CHUNK, dtype=SPECTRUM_DTYPE)
         
         # Visual settings
         self.WIDTH = width
         self.HEIGHT = height
+        self.SPECTRUM_BANDS = 80
         
         # Initialize PyGame
         pygame.init()
@@ -31,15 +121,27 @@ class AudioVisualizer:
         pygame.display.set_caption("Audio Visualizer - Press 1-5 for modes, SPACE to pause, ESC to quit")
         self.clock = pygame.time.Clock()
         
-        # Initialize PyAudio
-        self.p = pyaudio.PyAudio()
-        self.stream = self.p.open(
-            format=self.FORMAT,
+        # Fonts and text overlays are built once; mode/FPS labels are memoized
+        self._font = pygame.font.Font(None, 36)
+        self._pause_font = pygame.font.Font(None, 72)
+        self._pause_text = self._pause_font.render("PAUSED", True, (255, 100, 100))
+        self._text_cache = {}
+        
+        # Initialize audio input: the PortAudio callback copies each block into
+        # the next slot of a small ring buffer, so reading never blocks
+        self._ring = np.zeros((4, self.CHUNK), dtype=np.int16)
+        self._blocks_written = 0
+        self._blocks_seen = 0
+        self._fresh_audio = True
+        self._time_step = 1.0
+        self.stream = sd.InputStream(
+            samplerate=self.RATE,
+            blocksize=self.CHUNK,
+            dtype=self.FORMAT,
             channels=self.CHANNELS,
-            rate=self.RATE,
-            input=True,
-            frames_per_buffer=self.CHUNK
+            callback=self._audio_callback
         )
+        self.stream.start()
         
         # Visualization state
         self.mode = 1
@@ -48,57 +150,124 @@ class AudioVisualizer:
         
         # Beat detection
         self.beat_history = deque(maxlen=20)
+        self._beat_sum = 0.0
+        self._beat_appends = 0
         self.beat_threshold = 1.3
         self.beat_detected = False
         self.beat_cooldown = 0
+        self.bass_energy = 0.0
+        # Focus on bass frequencies (roughly 20-200 Hz)
+        self._bass_end = int(200 * self.CHUNK / self.RATE)
         
-        # Smoothing buffers
-        self.freq_smooth = deque(maxlen=3)
+        # Smoothing buffers (ring buffer of the last 3 spectra plus their running sum)
+        self._smooth_buf = np.zeros((SMOOTH_FRAMES, self.CHUNK // 2), dtype=SPECTRUM_DTYPE)
+        self._smooth_sum = np.zeros(self.CHUNK // 2, dtype=SPECTRUM_DTYPE)
+        self._smooth_idx = 0
+        self._smooth_count = 0
         self.amplitude_history = deque(maxlen=100)
         
-        # Particle system for mode 5
-        self.particles = []
-        
-    def get_audio_data(self):
-        """Read and process audio data from microphone"""
-        try:
-            data = np.frombuffer(
-                self.stream.read(self.CHUNK, exception_on_overflow=False),
-                dtype=np.int16
-            )
-            return data
-        except:
+        # Band start offsets for each band count used by the draw modes
+        self._band_edges = {
+            n: np.arange(n) * (self.CHUNK // 2 // n) for n in (32, 64, 80, 120, 200)
+        }
+        
+        # Unit-circle lookup tables for the radial draw modes, keyed by band count
+        self._cos = {}
+        self._sin = {}
+        for n in (32, 120, 200):
+            angles = np.arange(n) * (2 * math.pi / n)
+            self._cos[n] = np.cos(angles)
+            self._sin[n] = np.sin(angles)
+        
+        # Color wheels indexed by hue * 256; mode 5 fades by remaining life
+        self._circular_lut = _hue_table(0.8, 0.9)
+        self._wave_lut = _hue_table(0.7, 0.8)
+        self._particle_lut = np.stack([_hue_table(0.9, life / 60.0) for life in range(61)])
+        
+        # Prerendered gradient bars for mode 2
+        self._build_spectrum_columns()
+        
+        # Particle system for mode 5 (one array per field, fixed capacity)
+        self.MAX_PARTICLES = 512
+        self._px = np.zeros(self.MAX_PARTICLES, dtype=np.float32)
+        self._py = np.zeros(self.MAX_PARTICLES, dtype=np.float32)
+        self._vx = np.zeros(self.MAX_PARTICLES, dtype=np.float32)
+        self._vy = np.zeros(self.MAX_PARTICLES, dtype=np.float32)
+        self._life = np.zeros(self.MAX_PARTICLES, dtype=np.float32)
+        self._hue = np.zeros(self.MAX_PARTICLES, dtype=np.float32)
+        self._alive = np.zeros(self.MAX_PARTICLES, dtype=bool)
+        self._build_particle_sprites()
+        
+    def _build_particle_sprites(self, num_hues=32):
+        """Prerender a faded circle sprite for every (life, hue bucket) pair"""
+        self._sprite_hues = num_hues
+        self._particle_sprites = [None]
+        for life in range(1, 61):
+            radius = int(3 * life / 60.0) + 1
+            row = []
+            for bucket in range(num_hues):
+                color = self._particle_lut[life, bucket * 256 // num_hues].tolist()
+                sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+                pygame.draw.circle(sprite, color, (radius, radius), radius)
+                row.append(sprite.convert_alpha())
+            self._particle_sprites.append(row)
+        
+    def _build_spectrum_columns(self):
+        """Prerender a one-pixel-wide gradient column for every spectrum bar height"""
+        self._columns = [None]
+        for height in range(1, self.HEIGHT - 20 + 1):
+            # Color gradient based on height
+            intensity = height / self.HEIGHT
+            hue = (0.6 - intensity * 0.6) % 1.0  # Blue to red
+            color = np.array([int(c * 255) for c in colorsys.hsv_to_rgb(hue, 0.9, 0.9)])
+            
+            # Fade from full brightness at the bottom to 70% at the top
+            j = np.arange(height)[::-1]
+            alpha = 1 - (j / height) * 0.3
+            column = (alpha[:, None] * color).astype(np.uint8)
+            self._columns.append(pygame.surfarray.make_surface(column[None]).convert())
+        
+    def _audio_callback(self, indata, frames, time, status):
+        """Store a captured block in the ring buffer (runs on the PortAudio thread)"""
+        self._ring[self._blocks_written % len(self._ring), :frames] = indata[:, 0]
+        self._blocks_written += 1
+    
+    def get_audio_data(self, written=None):
+        """Return block number `written` (default: the most recent) from the microphone"""
+        if written is None:
+            written = self._blocks_written
+        if written == 0:
             return np.zeros(self.CHUNK, dtype=np.int16)
+        return self._ring[(written - 1) % len(self._ring)].copy()
     
     def analyze_audio(self, data):
         """Perform FFT and extract frequency bands"""
-        # Apply Hamming window to reduce spectral leakage
-        windowed = data * np.hamming(len(data))
-        
-        # Perform FFT
-        fft = np.fft.fft(windowed)
-        fft_magnitude = np.abs(fft[:self.CHUNK//2])
-        
-        # Normalize
-        fft_magnitude = fft_magnitude / (self.CHUNK / 2)
-        
-        # Apply logarithmic scaling for better visualization
-        fft_magnitude = np.log10(fft_magnitude + 1) * 20
-        
-        # Smooth the frequency data
-        self.freq_smooth.append(fft_magnitude)
-        smoothed = np.mean(self.freq_smooth, axis=0)
+        # Average over the spectra seen so far until the ring buffer has filled
+        self._smooth_count = min(self._smooth_count + 1, SMOOTH_FRAMES)
+        smoothed, self.bass_energy = _process(
+            data, self._window, self._scratch, self._smooth_buf, self._smooth_sum,
+            self._smooth_idx, self._bass_end, 1.0 / self._smooth_count
+        )
+        self._smooth_idx = (self._smooth_idx + 1) % SMOOTH_FRAMES
         
         return smoothed
     
-    def detect_beat(self, fft_data):
+    def detect_beat(self, bass_energy):
         """Simple beat detection using low frequency energy"""
-        # Focus on bass frequencies (roughly 20-200 Hz)
-        bass_range = int(200 * self.CHUNK / self.RATE)
-        bass_energy = np.sum(fft_data[:bass_range])
-        
+        # Keep a running total so the average is O(1) per frame
+        bass_energy = float(bass_energy)
+        if len(self.beat_history) == self.beat_history.maxlen:
+            self._beat_sum -= self.beat_history[0]
         self.beat_history.append(bass_energy)
-        avg_energy = np.mean(self.beat_history)
+        self._beat_sum += bass_energy
+        
+        # Recompute exactly once per history length so rounding cannot accumulate,
+        # and never let a residue below zero make silence look like a beat
+        self._beat_appends += 1
+        if self._beat_appends == self.beat_history.maxlen:
+            self._beat_appends = 0
+            self._beat_sum = math.fsum(self.beat_history)
+        avg_energy = max(self._beat_sum, 0.0) / len(self.beat_history)
         
         # Cooldown mechanism to avoid double-triggering
         if self.beat_cooldown > 0:
@@ -115,15 +284,13 @@ class AudioVisualizer:
     def get_frequency_bands(self, fft_data, num_bands=64):
         """Split FFT data into frequency bands for visualization"""
         band_size = len(fft_data) // num_bands
-        bands = []
-        
-        for i in range(num_bands):
-            start = i * band_size
-            end = start + band_size
-            band_avg = np.mean(fft_data[start:end])
-            bands.append(band_avg)
+        edges = self._band_edges.get(num_bands)
+        if edges is None:
+            edges = self._band_edges[num_bands] = np.arange(num_bands) * band_size
         
-        return np.array(bands)
+        # Sum every band in one pass; the leftover tail past the last band is dropped
+        sums = np.add.reduceat(fft_data[:num_bands * band_size], edges)
+        return sums * (1.0 / band_size)
     
     def draw_mode_1_circular(self, fft_data):
         """Circular frequency bars"""
@@ -132,68 +299,62 @@ class AudioVisualizer:
         bands = self.get_frequency_bands(fft_data, 120)
         center_x, center_y = self.WIDTH // 2, self.HEIGHT // 2
         radius = min(self.WIDTH, self.HEIGHT) // 3
+        cos, sin = self._cos[120], self._sin[120]
         
-        for i, magnitude in enumerate(bands):
-            angle = (i / len(bands)) * 2 * math.pi
-            
-            # Calculate color based on frequency and beat
-            hue = (self.hue + i / len(bands)) % 1.0
-            rgb = colorsys.hsv_to_rgb(hue, 0.8, 0.9)
-            color = tuple(int(c * 255) for c in rgb)
-            
-            # Scale magnitude for visualization
-            bar_length = magnitude * 3
-            if self.beat_detected:
-                bar_length *= 1.5
-            
-            # Inner and outer points
-            x1 = center_x + int(radius * math.cos(angle))
-            y1 = center_y + int(radius * math.sin(angle))
-            x2 = center_x + int((radius + bar_length) * math.cos(angle))
-            y2 = center_y + int((radius + bar_length) * math.sin(angle))
-            
+        # Scale magnitude for visualization
+        bar_length = bands * 3
+        if self.beat_detected:
+            bar_length *= 1.5
+        
+        # Inner and outer points for every bar at once
+        outer_radius = radius + bar_length
+        inner = np.column_stack((center_x + (radius * cos).astype(int),
+                                 center_y + (radius * sin).astype(int))).tolist()
+        outer = np.column_stack((center_x + (outer_radius * cos).astype(int),
+                                 center_y + (outer_radius * sin).astype(int))).tolist()
+        
+        # Calculate color based on frequency
+        hues = self.hue + np.arange(len(bands)) / len(bands)
+        colors = self._circular_lut[(hues * 256).astype(int) & 255].tolist()
+        
+        for start, end, color in zip(inner, outer, colors):
             # Draw line with thickness
-            pygame.draw.line(self.screen, color, (x1, y1), (x2, y2), 3)
+            pygame.draw.line(self.screen, color, start, end, 3)
     
     def draw_mode_2_spectrum(self, fft_data):
         """Classic spectrum analyzer bars"""
         self.screen.fill((5, 5, 15))
         
-        bands = self.get_frequency_bands(fft_data, 80)
+        bands = self.get_frequency_bands(fft_data, self.SPECTRUM_BANDS)
         bar_width = self.WIDTH // len(bands)
-        
-        for i, magnitude in enumerate(bands):
-            bar_height = min(magnitude * 4, self.HEIGHT - 20)
-            
-            # Color gradient based on height
-            intensity = bar_height / self.HEIGHT
-            hue = (0.6 - intensity * 0.6) % 1.0  # Blue to red
-            rgb = colorsys.hsv_to_rgb(hue, 0.9, 0.9)
-            color = tuple(int(c * 255) for c in rgb)
-            
-            x = i * bar_width
-            y = self.HEIGHT - bar_height
-            
-            # Draw bar with gradient effect
-            for j in range(int(bar_height)):
-                alpha = 1 - (j / bar_height) * 0.3
-                fade_color = tuple(int(c * alpha) for c in color)
-                pygame.draw.line(self.screen, fade_color, 
-                               (x, self.HEIGHT - j), (x + bar_width - 2, self.HEIGHT - j))
+        bar_heights = np.minimum(bands * 4, self.HEIGHT - 20).astype(int)
+        
+        # Destination x and height for every visible bar
+        visible = np.flatnonzero(bar_heights > 0)
+        heights = bar_heights[visible]
+        
+        # Stretch each bar's gradient column to the bar width and blit them in one call
+        columns = self._columns
+        width = max(bar_width - 1, 1)
+        scale = pygame.transform.scale
+        self.screen.blits(
+            [(scale(columns[h], (width, h)), (x, self.HEIGHT - h))
+             for x, h in zip((visible * bar_width).tolist(), heights.tolist())],
+            doreturn=False
+        )
     
     def draw_mode_3_waveform(self, audio_data):
         """Oscilloscope-style waveform"""
         self.screen.fill((0, 0, 0))
         
         # Downsample for visualization
-        step = len(audio_data) // self.WIDTH
-        points = []
+        step = max(1, len(audio_data) // self.WIDTH)
+        samples = audio_data[::step].astype(np.float32)
         
-        for i in range(0, len(audio_data), step):
-            x = (i // step)
-            # Normalize and scale
-            y = self.HEIGHT // 2 + int((audio_data[i] / 32768.0) * (self.HEIGHT // 3))
-            points.append((x, y))
+        # Normalize and scale
+        ys = self.HEIGHT // 2 + (samples * ((self.HEIGHT // 3) / 32768.0)).astype(np.int32)
+        xs = np.arange(len(ys), dtype=np.int32)
+        points = np.column_stack((xs, ys)).tolist()
         
         if len(points) > 1:
             # Draw waveform with glow effect
@@ -207,74 +368,75 @@ class AudioVisualizer:
         
         bands = self.get_frequency_bands(fft_data, 200)
         center_x, center_y = self.WIDTH // 2, self.HEIGHT // 2
+        cos, sin = self._cos[200], self._sin[200]
         
-        # Create multiple concentric waves
-        for wave in range(3):
-            points = []
-            base_radius = 100 + wave * 80
-            
-            for i, magnitude in enumerate(bands):
-                angle = (i / len(bands)) * 2 * math.pi
-                radius = base_radius + magnitude * (2 - wave * 0.5)
-                
-                x = center_x + int(radius * math.cos(angle))
-                y = center_y + int(radius * math.sin(angle))
-                points.append((x, y))
-            
-            # Close the loop
-            points.append(points[0])
+        # Create multiple concentric waves, computing all three rings at once
+        waves = np.arange(3)
+        base_radius = 100 + waves * 80
+        radii = base_radius[:, None] + bands * (2 - waves * 0.5)[:, None]
+        xs = center_x + (radii * cos).astype(int)
+        ys = center_y + (radii * sin).astype(int)
+        
+        for wave in waves:
+            points = np.column_stack((xs[wave], ys[wave])).tolist()
             
             # Color based on wave number
-            hue = (self.hue + wave * 0.2) % 1.0
-            rgb = colorsys.hsv_to_rgb(hue, 0.7, 0.8)
-            color = tuple(int(c * 255) for c in rgb)
+            hue = self.hue + wave * 0.2
+            color = self._wave_lut[int(hue * 256) & 255].tolist()
             
-            if len(points) > 2:
-                pygame.draw.lines(self.screen, color, False, points, 2)
+            # Draw as a closed loop
+            pygame.draw.lines(self.screen, color, True, points, 2)
     
     def draw_mode_5_particles(self, fft_data):
         """Particle explosion system"""
         self.screen.fill((0, 0, 10))
         
-        # Spawn particles on beat
-        if self.beat_detected:
+        # Spawn particles on beat into free slots (extras are dropped when full),
+        # once per analyzed block rather than on every frame that redraws it
+        if self.beat_detected and self._fresh_audio:
             bands = self.get_frequency_bands(fft_data, 32)
-            for i, magnitude in enumerate(bands):
-                if magnitude > 5:
-                    angle = (i / len(bands)) * 2 * math.pi
-                    speed = magnitude * 0.5
-                    self.particles.append({
-                        'x': self.WIDTH // 2,
-                        'y': self.HEIGHT // 2,
-                        'vx': math.cos(angle) * speed,
-                        'vy': math.sin(angle) * speed,
-                        'life': 60,
-                        'hue': (self.hue + i / len(bands)) % 1.0
-                    })
-        
-        # Update and draw particles
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['vy'] += 0.2  # Gravity
-            particle['life'] -= 1
-            
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
-                continue
+            spawn = np.flatnonzero(bands > 5)
+            slots = np.flatnonzero(~self._alive)[:len(spawn)]
+            spawn = spawn[:len(slots)]
+            speed = bands[spawn] * 0.5
             
-            # Draw particle with fade
-            alpha = particle['life'] / 60.0
-            rgb = colorsys.hsv_to_rgb(particle['hue'], 0.9, alpha)
-            color = tuple(int(c * 255) for c in rgb)
-            
-            size = int(3 * alpha) + 1
-            pygame.draw.circle(self.screen, color, 
-                             (int(particle['x']), int(particle['y'])), size)
+            self._px[slots] = self.WIDTH // 2
+            self._py[slots] = self.HEIGHT // 2
+            self._vx[slots] = self._cos[32][spawn] * speed
+            self._vy[slots] = self._sin[32][spawn] * speed
+            self._life[slots] = 60
+            self._hue[slots] = (self.hue + spawn / len(bands)) % 1.0
+            self._alive[slots] = True
+        
+        # Update all particles at once, scaled by the elapsed time step
+        step = self._time_step
+        alive = self._alive
+        self._px[alive] += self._vx[alive] * step
+        self._py[alive] += self._vy[alive] * step
+        self._vy[alive] += 0.2 * step  # Gravity
+        self._life[alive] -= step
+        alive &= self._life > 0
+        
+        # Draw particles with fade as one batch of prerendered sprites
+        live = np.flatnonzero(alive)
+        life = np.ceil(self._life[live]).astype(int)
+        radius = (3 * life) // 60 + 1
+        xs = self._px[live].astype(int) - radius
+        ys = self._py[live].astype(int) - radius
+        hue_idx = (self._hue[live] * self._sprite_hues).astype(int) % self._sprite_hues
+        
+        sprites = self._particle_sprites
+        self.screen.blits(
+            [(sprites[l][h], (x, y))
+             for l, h, x, y in zip(life.tolist(), hue_idx.tolist(), xs.tolist(), ys.tolist())],
+            doreturn=False
+        )
     
     def run(self):
         """Main visualization loop"""
         running = True
+        audio_data = np.zeros(self.CHUNK, dtype=np.int16)
+        fft_data = np.zeros(self.CHUNK // 2, dtype=SPECTRUM_DTYPE)
         
         while running:
             # Handle events
@@ -288,16 +450,24 @@ class AudioVisualizer:
                         self.paused = not self.paused
                     elif pygame.K_1 <= event.key <= pygame.K_5:
                         self.mode = event.key - pygame.K_0
-                        self.particles.clear()  # Clear particles on mode change
+                        self._alive[:] = False  # Clear particles on mode change
+            
+            # Frame duration relative to one audio block (clamped after stalls)
+            self._time_step = min(self.clock.get_time() / BLOCK_MS, MAX_TIME_STEP)
             
             if not self.paused:
-                # Get and analyze audio
-                audio_data = self.get_audio_data()
-                fft_data = self.analyze_audio(audio_data)
-                self.beat_detected = self.detect_beat(fft_data)
+                # Analyze audio only when the callback has delivered a new block;
+                # frames in between redraw the last spectrum at the display rate
+                written = self._blocks_written
+                self._fresh_audio = written != self._blocks_seen
+                if self._fresh_audio:
+                    self._blocks_seen = written
+                    audio_data = self.get_audio_data(written)
+                    fft_data = self.analyze_audio(audio_data)
+                    self.beat_detected = self.detect_beat(self.bass_energy)
                 
                 # Update hue for color cycling
-                self.hue = (self.hue + 0.002) % 1.0
+                self.hue = (self.hue + 0.002 * self._time_step) % 1.0
                 
                 # Draw based on current mode
                 if self.mode == 1:
@@ -312,15 +482,18 @@ class AudioVisualizer:
                     self.draw_mode_5_particles(fft_data)
                 
                 # Display mode info
-                font = pygame.font.Font(None, 36)
-                mode_text = font.render(f"Mode {self.mode} | FPS: {int(self.clock.get_fps())}", 
-                                      True, (200, 200, 200))
+                key = (self.mode, int(self.clock.get_fps()))
+                mode_text = self._text_cache.get(key)
+                if mode_text is None:
+                    if len(self._text_cache) >= 64:
+                        self._text_cache.clear()
+                    mode_text = self._font.render(f"Mode {key[0]} | FPS: {key[1]}", 
+                                                  True, (200, 200, 200))
+                    self._text_cache[key] = mode_text
                 self.screen.blit(mode_text, (10, 10))
             else:
-                font = pygame.font.Font(None, 72)
-                pause_text = font.render("PAUSED", True, (255, 100, 100))
-                text_rect = pause_text.get_rect(center=(self.WIDTH//2, self.HEIGHT//2))
-                self.screen.blit(pause_text, text_rect)
+                text_rect = self._pause_text.get_rect(center=(self.WIDTH//2, self.HEIGHT//2))
+                self.screen.blit(self._pause_text, text_rect)
             
             pygame.display.flip()
             self.clock.tick(60)
@@ -329,9 +502,8 @@ class AudioVisualizer:
     
     def cleanup(self):
         """Clean up resources"""
-        self.stream.stop_stream()
+        self.stream.stop()
         self.stream.close()
-        self.p.terminate()
         pygame.quit()
 
 if __name__ == "__main__":
@@ -12,19 +12,19 @@ fi
 
 echo "✓ Python 3 found"
 
-# Install system dependencies for PyAudio (platform-specific)
+# Install system dependencies for sounddevice (platform-specific)
 echo ""
 echo "Installing system dependencies..."
 
 if [[ "$OSTYPE" == "linux-gnu"* ]]; then
     echo "Detected Linux"
-    echo "Run: sudo apt-get install python3-pyaudio portaudio19-dev"
+    echo "Run: sudo apt-get install libportaudio2"
 elif [[ "$OSTYPE" == "darwin"* ]]; then
     echo "Detected macOS"
-    echo "Run: brew install portaudio"
+    echo "sounddevice ships with PortAudio on macOS"
 elif [[ "$OSTYPE" == "msys" ]] || [[ "$OSTYPE" == "win32" ]]; then
     echo "Detected Windows"
-    echo "PyAudio should install via pip on Windows"
+    echo "sounddevice ships with PortAudio on Windows"
 fi
 
 echo ""